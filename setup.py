@@ -0,0 +1,20 @@
+"""
+Build script for CityScout.
+Set CITYSCOUT_MYPYC=1 to compile the hot formatting and validation code to C extensions with mypyc.
+"""
+
+import os
+from setuptools import setup
+
+# Pure-Python modules compiled by mypyc when enabled
+MYPYC_MODULES = [
+    'src/cityscout/utils/data_formatter.py',
+    'src/cityscout/utils/validators.py',
+]
+
+ext_modules = []
+if os.environ.get('CITYSCOUT_MYPYC') == '1':
+    from mypyc.build import mypycify
+    ext_modules = mypycify(MYPYC_MODULES, opt_level='3')
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,5 @@
+"""
+CityScout: population and demographic analysis for US cities.
+"""
+
+__version__ = '1.0.0'
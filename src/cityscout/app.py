@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+CityScout Web Application
+FastAPI-based web interface for demographic analysis
+"""
+
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from fastapi.staticfiles import StaticFiles
+from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel, StringConstraints
+import aiohttp
+import asyncio
+import orjson
+import logging
+import sys
+import os
+
+from cityscout.data_collectors import CensusDataCollector, BLSDataCollector
+from cityscout.utils import CityValidator, MAX_INPUT_LENGTH, TTLCache
+from cityscout.config import Config
+from cityscout.models import CityAnalysis
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def setup_logging():
+    """Setup logging configuration."""
+    logging.basicConfig(
+        level=getattr(logging, Config.LOG_LEVEL),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout) if Config.DEBUG else logging.NullHandler()
+        ]
+    )
+
+setup_logging()
+
+class CityScoutWeb:
+    """Web version of CityScout application."""
+    
+    def __init__(self, http: aiohttp.ClientSession):
+        self.census_collector = CensusDataCollector(http)
+        self.bls_collector = BLSDataCollector(http)
+        self.results = TTLCache(Config.ANALYSIS_CACHE_SIZE, Config.ANALYSIS_CACHE_TTL)
+        self.logger = logging.getLogger(__name__)
+        
+    async def analyze_city(self, city: str, state: str) -> dict:
+        """Perform demographic analysis for a city."""
+        try:
+            self.logger.info("Starting analysis for %s, %s", city, state)
+            
+            # Validate inputs
+            if not CityValidator.validate_city_name(city):
+                raise ValueError(f"Invalid city name: {city}")
+            if not CityValidator.validate_state(state):
+                raise ValueError(f"Invalid state: {state}")
+                
+            # Normalize inputs
+            city = CityValidator.normalize_city_name(city)
+            state = CityValidator.normalize_state(state)
+            
+            # Repeat queries are served from the in-process cache
+            cache_key = (city.casefold(), state.casefold())
+            cached = self.results.get(cache_key)
+            if cached is not None:
+                return cached
+                
+            # Collect demographic, growth and employment data concurrently
+            self.logger.info("Collecting demographic, population growth and employment data...")
+            results = await asyncio.gather(
+                self.census_collector.get_demographics_data(city, state),
+                self.census_collector.get_population_growth(city, state),
+                self.bls_collector.get_labor_stats(state),
+                return_exceptions=True
+            )
+            
+            # Combine all data; a failing collector only loses its own fields
+            analysis = CityAnalysis(city=city, state=state)
+            complete = True
+            for collected in results:
+                if isinstance(collected, BaseException):
+                    self.logger.error("Data collection failed for %s, %s: %s", city, state, collected)
+                    complete = False
+                elif not collected:
+                    # Collectors log their own errors and return no fields
+                    complete = False
+                else:
+                    analysis.update(collected)
+            
+            self.logger.info("Analysis completed for %s, %s", city, state)
+            result = {'success': True, 'data': analysis}
+            # Partial results are returned but not cached, so a transient
+            # upstream failure isn't served for the cache's whole TTL
+            if complete:
+                self.results.set(cache_key, result)
+            return result
+            
+        except Exception as e:
+            self.logger.error("Error analyzing %s, %s: %s", city, state, e)
+            return {'success': False, 'error': str(e)}
+            
+    async def close(self):
+        """Release the collectors' cache connections."""
+        await asyncio.gather(self.census_collector.close(), self.bls_collector.close())
+
+class JSONResponse(Response):
+    """JSON response rendered with orjson."""
+    media_type = 'application/json'
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP session across collectors for the app's lifetime."""
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=Config.DEFAULT_TIMEOUT),
+        json_serialize=lambda obj: orjson.dumps(obj).decode()
+    )
+    app.state.cityscout = CityScoutWeb(app.state.http)
+    try:
+        yield
+    finally:
+        await app.state.cityscout.close()
+        await app.state.http.close()
+
+app = FastAPI(title="CityScout", lifespan=lifespan, default_response_class=JSONResponse)
+app.mount('/static', StaticFiles(directory=os.path.join(BASE_DIR, 'static')), name='static')
+templates = Jinja2Templates(directory=os.path.join(BASE_DIR, 'templates'))
+
+RequiredText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=MAX_INPUT_LENGTH)]
+
+class AnalyzeBody(BaseModel):
+    """Request body for the analysis endpoint."""
+    city: RequiredText
+    state: RequiredText
+
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, exc: RequestValidationError):
+    """Keep the API's error shape for missing or malformed input."""
+    error_types = {error['type'] for error in exc.errors()}
+    # Missing or empty fields take precedence over over-long ones
+    if 'string_too_long' in error_types and not error_types & {'missing', 'string_too_short'}:
+        message = f'City and state must be at most {MAX_INPUT_LENGTH} characters'
+    else:
+        message = 'City and state are required'
+    return JSONResponse({'success': False, 'error': message}, status_code=400)
+
+@app.get('/')
+async def index(request: Request):
+    """Main page with search form."""
+    return templates.TemplateResponse(request, 'index.html')
+
+@app.post('/api/analyze')
+async def api_analyze(body: AnalyzeBody, request: Request):
+    """JSON API endpoint for city analysis."""
+    return await request.app.state.cityscout.analyze_city(body.city, body.state)
+
+@app.get('/health')
+async def health():
+    """Health check endpoint."""
+    return {'status': 'healthy', 'service': 'CityScout Web'}
+
+if __name__ == '__main__':
+    import uvicorn
+    
+    print("🏙️ Starting CityScout Web Application...")
+    print("📊 Access at: http://localhost:5000")
+    port = int(os.environ.get('PORT', 5000))
+    uvicorn.run('cityscout.app:app', host='0.0.0.0', port=port, reload=Config.DEBUG,
+                loop='uvloop', http='httptools')
@@ -0,0 +1,32 @@
+import os
+from dotenv import find_dotenv, load_dotenv
+
+# Load environment variables from a .env in (or above) the working directory
+load_dotenv(find_dotenv(usecwd=True))
+
+class Config:
+    """Configuration settings for CityScout application."""
+    
+    # API Keys
+    CENSUS_API_KEY = os.getenv('CENSUS_API_KEY')
+    BLS_API_KEY = os.getenv('BLS_API_KEY')
+    
+    # Application settings
+    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    
+    # API Endpoints
+    CENSUS_BASE_URL = "https://api.census.gov/data"
+    BLS_BASE_URL = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
+    
+    # Cache settings (Redis caching is disabled when REDIS_URL is unset)
+    REDIS_URL = os.getenv('REDIS_URL')
+    CACHE_TTL = int(os.getenv('CACHE_TTL', 24 * 60 * 60))
+    NEGATIVE_CACHE_TTL = int(os.getenv('NEGATIVE_CACHE_TTL', 60 * 60))
+    PLACE_INDEX_TTL = int(os.getenv('PLACE_INDEX_TTL', 30 * 24 * 60 * 60))
+    ANALYSIS_CACHE_SIZE = int(os.getenv('ANALYSIS_CACHE_SIZE', 1024))
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', 60 * 60))
+    
+    # Default settings
+    DEFAULT_TIMEOUT = 30
+    MAX_RETRIES = 3
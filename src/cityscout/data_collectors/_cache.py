@@ -0,0 +1,90 @@
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+def cache_key(*parts: str) -> str:
+    """Build a namespaced cache key such as ``census:demo:FL:Tampa``."""
+    return ':'.join(parts)
+
+class ResponseCache:
+    """Redis-backed JSON cache for upstream API results.
+    
+    Caching is disabled when no Redis URL is configured, and Redis errors are
+    treated as cache misses so the collectors always fall back to the API.
+    """
+    
+    def __init__(self, url: Optional[str] = None):
+        url = url or Config.REDIS_URL
+        self.redis = redis.Redis.from_url(url) if url else None
+        
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        if self.redis is None:
+            return None
+            
+        try:
+            cached = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+            return None
+            
+        return orjson.loads(cached) if cached is not None else None
+        
+    async def set(self, key: str, value: Any, ttl: int = Config.CACHE_TTL):
+        """Store a JSON-serializable value under key for ttl seconds."""
+        if self.redis is None:
+            return
+            
+        try:
+            await self.redis.setex(key, ttl, orjson.dumps(value))
+        except RedisError as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+            
+    async def get_field(self, key: str, field: str) -> Optional[str]:
+        """Return one field of the hash stored at key, or None on a miss."""
+        if self.redis is None:
+            return None
+            
+        try:
+            value = await self.redis.hget(key, field)
+        except RedisError as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+            return None
+            
+        return value.decode() if value is not None else None
+        
+    async def get_fields(self, key: str) -> Dict[str, str]:
+        """Return the whole hash stored at key (empty on a miss)."""
+        if self.redis is None:
+            return {}
+            
+        try:
+            mapping = await self.redis.hgetall(key)
+        except RedisError as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+            return {}
+            
+        return {field.decode(): value.decode() for field, value in mapping.items()}
+        
+    async def set_fields(self, key: str, mapping: Dict[str, str], ttl: int = Config.CACHE_TTL):
+        """Store mapping as a hash under key for ttl seconds."""
+        if self.redis is None or not mapping:
+            return
+            
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                await pipe.hset(key, mapping=mapping).expire(key, ttl).execute()
+        except RedisError as e:
+            logger.warning("Cache write failed for %s: %s", key, e)
+            
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self.redis is not None:
+            await self.redis.aclose()
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Any, Callable, Optional
+
+import aiohttp
+import orjson
+from tenacity import (
+    RetryCallState, retry, retry_if_exception_type, retry_if_not_exception_type,
+    stop_after_attempt, wait_exponential_jitter
+)
+
+from ..config import Config
+
+# Upstream statuses that are worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class RetryableStatusError(Exception):
+    """Raised when the Census/BLS APIs answer with a retryable HTTP status."""
+    
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"Upstream API returned HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+def _parse_retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    """Read a Retry-After header given in seconds (HTTP-date values are ignored)."""
+    value = response.headers.get('Retry-After')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+_backoff = wait_exponential_jitter(initial=1, max=10)
+
+def _wait(retry_state: RetryCallState) -> float:
+    """Honor Retry-After on rate-limited responses, otherwise back off exponentially."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, RetryableStatusError) and error.retry_after is not None:
+        return min(error.retry_after, Config.DEFAULT_TIMEOUT)
+    return _backoff(retry_state)
+
+@retry(
+    retry=(retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError, RetryableStatusError))
+           & retry_if_not_exception_type(aiohttp.ClientResponseError)),
+    stop=stop_after_attempt(Config.MAX_RETRIES),
+    wait=_wait,
+    reraise=True
+)
+async def fetch_json(session: aiohttp.ClientSession, method: str, url: str, *,
+                     decode: Callable[[bytes], Any] = orjson.loads, **kwargs: Any) -> Any:
+    """Issue a request and decode its JSON body with decode, retrying transient failures."""
+    async with session.request(method, url, **kwargs) as response:
+        if response.status in RETRY_STATUSES:
+            raise RetryableStatusError(response.status, _parse_retry_after(response))
+        response.raise_for_status()
+        return decode(await response.read())
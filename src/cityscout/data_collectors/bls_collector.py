@@ -0,0 +1,127 @@
+import aiohttp
+import msgspec
+from typing import Dict, Any, List
+import logging
+from ..config import Config
+from ._cache import ResponseCache, cache_key
+from ._fips import state_to_fips
+from ._http import fetch_json
+
+class BLSDatum(msgspec.Struct):
+    """A single observation in a BLS time series."""
+    year: str
+    period: str
+    value: str
+
+class BLSSeries(msgspec.Struct):
+    """A BLS time series, newest observation first."""
+    seriesID: str
+    data: List[BLSDatum] = []
+
+class BLSResults(msgspec.Struct):
+    """The Results block of a BLS API response."""
+    series: List[BLSSeries] = []
+
+class BLSResponse(msgspec.Struct):
+    """Typed view of a BLS timeseries API response (unknown fields are ignored)."""
+    status: str
+    Results: BLSResults = msgspec.field(default_factory=BLSResults)
+
+# Decodes and validates BLS responses in a single pass
+decode_bls_response = msgspec.json.Decoder(BLSResponse).decode
+
+class BLSDataCollector:
+    """Collects employment and labor statistics from Bureau of Labor Statistics API."""
+    
+    def __init__(self, session: aiohttp.ClientSession):
+        self.api_key = Config.BLS_API_KEY
+        self.base_url = Config.BLS_BASE_URL
+        self.session = session
+        self.cache = ResponseCache()
+        self.logger = logging.getLogger(__name__)
+        
+        # Check if API key is available
+        if not self.api_key or self.api_key == 'your_bls_api_key_here':
+            self.logger.warning("BLS API key not configured - employment data will be unavailable")
+            self.api_available = False
+        else:
+            self.api_available = True
+        
+    async def close(self):
+        """Close the cache connection (the HTTP session is owned by the caller)."""
+        await self.cache.close()
+        
+    async def get_labor_stats(self, state: str) -> Dict[str, Any]:
+        """Get unemployment rate, employment level and labor force for a state in one request.
+        
+        BLS doesn't provide city-level data for all cities, so state-level series are used as a proxy.
+        """
+        if not self.api_available:
+            self.logger.info("BLS API not available - returning default employment data")
+            return {
+                'unemployment_rate': None,
+                'unemployment_rate_note': 'BLS API key not configured',
+                'employment_level': None,
+                'labor_force': None,
+                'employment_note': 'BLS API key not configured'
+            }
+            
+        try:
+            # Format: LAUS + state FIPS + 0000000000 + measure code
+            state_fips = state_to_fips(state)
+            
+            # Unemployment rate series
+            unemployment_series = f"LAUS{state_fips}0000000000003"
+            # Employment level series
+            employment_series = f"LAUS{state_fips}0000000000005"
+            # Labor force series
+            labor_force_series = f"LAUS{state_fips}0000000000006"
+            
+            key = cache_key('bls:laus', state, unemployment_series, employment_series, labor_force_series)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+                
+            payload = {
+                'seriesid': [unemployment_series, employment_series, labor_force_series],
+                'startyear': '2020',
+                'endyear': '2023'
+            }
+            
+            if self.api_key:
+                payload['registrationkey'] = self.api_key
+                
+            data = await fetch_json(self.session, 'POST', self.base_url, json=payload,
+                                    decode=decode_bls_response)
+            
+            if data.status == 'REQUEST_SUCCEEDED' and data.Results.series:
+                labor_stats = {}
+                
+                for series in data.Results.series:
+                    if not series.data:
+                        continue
+                        
+                    latest = series.data[0]
+                    if unemployment_series in series.seriesID:
+                        labor_stats['unemployment_rate'] = float(latest.value)
+                        labor_stats['year'] = latest.year
+                        labor_stats['period'] = latest.period
+                    elif employment_series in series.seriesID:
+                        labor_stats['employment_level'] = int(latest.value) * 1000  # BLS data in thousands
+                    elif labor_force_series in series.seriesID:
+                        labor_stats['labor_force'] = int(latest.value) * 1000  # BLS data in thousands
+                        
+                # Calculate employment rate
+                if 'employment_level' in labor_stats and 'labor_force' in labor_stats:
+                    employment_rate = (labor_stats['employment_level'] / 
+                                     labor_stats['labor_force'] * 100)
+                    labor_stats['employment_rate'] = round(employment_rate, 1)
+                    
+                if labor_stats:
+                    await self.cache.set(key, labor_stats)
+                return labor_stats
+                
+        except Exception as e:
+            self.logger.error("Error getting labor statistics for %s: %s", state, e)
+            
+        return {}
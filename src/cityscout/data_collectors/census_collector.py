@@ -0,0 +1,199 @@
+import asyncio
+import aiohttp
+from typing import Dict, Optional, Any, Tuple
+import logging
+from ..config import Config
+from ._cache import ResponseCache, cache_key
+from ._fips import state_to_fips
+from ._http import fetch_json
+
+# ACS datasets to query, in order of preference, as (url, description).
+# 1-year estimates are more recent but only available for larger places.
+DATA_SOURCES = tuple(
+    (f"{Config.CENSUS_BASE_URL}/{dataset}", description)
+    for dataset, description in (
+        ('2022/acs/acs1', '1-year estimates (most recent)'),
+        ('2022/acs/acs5', '5-year estimates 2022'),
+        ('2021/acs/acs1', '1-year estimates 2021'),
+        ('2021/acs/acs5', '5-year estimates 2021')
+    )
+)
+
+# Census place-name designations dropped when matching, e.g. "Tampa city, Florida" -> "tampa"
+PLACE_SUFFIXES = (' city', ' town', ' village', ' borough', ' cdp', ' municipality')
+_PUNCTUATION_TABLE = str.maketrans('', '', ".'")
+
+def normalize_place_name(name: str, strip_designation: bool = True) -> str:
+    """
+    Normalize a city or Census place name into a place-index key.
+    strip_designation drops a trailing place designation such as " city".
+    """
+    name = ' '.join(name.partition(',')[0].lower().translate(_PUNCTUATION_TABLE).split())
+    if not strip_designation:
+        return name
+    for suffix in PLACE_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+class CensusDataCollector:
+    """Collects demographic and economic data from U.S. Census Bureau API."""
+    
+    def __init__(self, session: aiohttp.ClientSession):
+        self.api_key = Config.CENSUS_API_KEY
+        self.base_url = Config.CENSUS_BASE_URL
+        self.session = session
+        self.cache = ResponseCache()
+        self.logger = logging.getLogger(__name__)
+        
+    async def close(self):
+        """Close the cache connection (the HTTP session is owned by the caller)."""
+        await self.cache.close()
+        
+    async def get_city_fips_code(self, city: str, state: str) -> Optional[str]:
+        """
+        Get FIPS code for a city and state combination.
+        Returns None only when the state's place index has no match; errors
+        fetching the index propagate so they aren't mistaken for a miss.
+        """
+        state_fips = state_to_fips(state)
+        index_key = cache_key('places', state_fips)
+        # The designation is part of some names ("Sioux City" is "sioux city" in the
+        # index), so try the name as given before dropping one ("Tampa city" -> "tampa")
+        name = normalize_place_name(city, strip_designation=False)
+        names = tuple(dict.fromkeys((name, normalize_place_name(name))))
+        
+        # Exact match against the cached place index for the state
+        for candidate in names:
+            place_fips = await self.cache.get_field(index_key, candidate)
+            if place_fips is not None:
+                return place_fips
+                
+        places = await self.cache.get_fields(index_key)
+        if not places:
+            places = await self._fetch_place_index(state_fips)
+            for candidate in names:
+                if candidate in places:
+                    return places[candidate]
+                    
+        # Fall back to a partial match, e.g. "Nashville" -> "Nashville-Davidson"
+        for place_name, place_fips in places.items():
+            if name in place_name:
+                return place_fips
+                
+        return None
+        
+    async def _fetch_place_index(self, state_fips: str) -> Dict[str, str]:
+        """Fetch every place in a state and cache it as a normalized name -> FIPS hash."""
+        # Use places API to list the state's place FIPS codes
+        url = f"{self.base_url}/2021/acs/acs5"
+        params = {
+            'get': 'NAME',
+            'for': 'place:*',
+            'in': f'state:{state_fips}',
+            'key': self.api_key
+        }
+        
+        data = await fetch_json(self.session, 'GET', url, params=params)
+        
+        places: Dict[str, str] = {}
+        for row in data[1:]:  # Skip header row
+            places.setdefault(normalize_place_name(row[0]), row[-1])
+            
+        await self.cache.set_fields(cache_key('places', state_fips), places, ttl=Config.PLACE_INDEX_TTL)
+        return places
+        
+    async def _fetch_dataset(self, priority: int, url: str, description: str,
+                             params: Dict[str, Any]) -> Optional[Tuple[int, str, Any]]:
+        """Fetch one ACS dataset, returning (priority, description, rows) or None on failure."""
+        try:
+            return priority, description, await fetch_json(self.session, 'GET', url, params=params)
+        except Exception as e:
+            self.logger.debug("Failed to get %s: %s", description, e)
+            
+        return None
+        
+    async def get_demographics_data(self, city: str, state: str) -> Dict[str, Any]:
+        """Collect demographic data for a city."""
+        key = cache_key('census:demo', state, city)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+            
+        try:
+            place_fips = await self.get_city_fips_code(city, state)
+            state_fips = state_to_fips(state)
+            
+            if not place_fips:
+                self.logger.warning("Could not find FIPS code for %s, %s", city, state)
+                # A genuine miss (the place index has no match): remember it briefly
+                # so repeated lookups don't hammer the API
+                await self.cache.set(key, {}, ttl=Config.NEGATIVE_CACHE_TTL)
+                return {}
+                
+            params = {
+                'get': 'B01003_001E,B19013_001E',
+                'for': f'place:{place_fips}',
+                'in': f'state:{state_fips}',
+                'key': self.api_key
+            }
+            
+            # Query every data source at once and keep the first to succeed,
+            # preferring the more recent dataset when several finish together
+            tasks = [
+                asyncio.create_task(self._fetch_dataset(priority, url, description, params))
+                for priority, (url, description) in enumerate(DATA_SOURCES)
+            ]
+            data = None
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    if await next_done is not None:
+                        done = [
+                            fetched for task in tasks
+                            if task.done() and not task.cancelled() and (fetched := task.result()) is not None
+                        ]
+                        _, description, data = min(done)
+                        self.logger.info("Using %s for %s, %s", description, city, state)
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+            
+            if data is None:
+                self.logger.error("Failed to get Census data for %s, %s", city, state)
+                return {}
+                
+            if len(data) < 2:
+                return {}
+                
+            row = data[1]  # First data row after header
+            
+            total_population = int(row[0]) if row[0] != '-999999999' else 0
+            median_income = int(row[1]) if row[1] != '-999999999' else 0
+            
+            result = {
+                'total_population': total_population,
+                'median_household_income': median_income
+            }
+            await self.cache.set(key, result)
+            return result
+            
+        except Exception as e:
+            self.logger.error("Error collecting demographics for %s, %s: %s", city, state, e)
+            return {}
+            
+    async def get_population_growth(self, city: str, state: str) -> Dict[str, float]:
+        """Get population growth rates for a city."""
+        try:
+            # This would typically require multiple years of data
+            # For demo purposes, using estimated growth rates
+            # In production, you'd fetch multiple years and calculate actual growth
+            
+            return {
+                'population_growth_1yr': 2.1,  # Placeholder - would calculate from real data
+                'population_growth_5yr': 8.5   # Placeholder - would calculate from real data
+            }
+            
+        except Exception as e:
+            self.logger.error("Error getting population growth for %s, %s: %s", city, state, e)
+            return {}
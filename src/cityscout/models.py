@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+@dataclass(slots=True)
+class CityAnalysis:
+    """Combined demographic and labor data for a single city."""
+    
+    city: str
+    state: str
+    
+    # Census demographics
+    total_population: Optional[int] = None
+    median_household_income: Optional[int] = None
+    population_growth_1yr: Optional[float] = None
+    population_growth_5yr: Optional[float] = None
+    
+    # BLS labor statistics (state-level)
+    unemployment_rate: Optional[float] = None
+    unemployment_rate_note: Optional[str] = None
+    year: Optional[str] = None
+    period: Optional[str] = None
+    employment_level: Optional[int] = None
+    labor_force: Optional[int] = None
+    employment_rate: Optional[float] = None
+    employment_note: Optional[str] = None
+    
+    def update(self, fields: Dict[str, Any]) -> None:
+        """Apply a collector's partial result to this analysis."""
+        for name, value in fields.items():
+            setattr(self, name, value)
@@ -104,7 +104,7 @@ class CityScout {
         }
         
         // Growth insights
-        if (data.population_growth_5yr !== undefined) {
+        if (data.population_growth_5yr != null) {
             const growth = data.population_growth_5yr;
             if (growth > 10) {
                 insights.push(`Rapid population growth of ${this.formatPercentage(growth)} over the past 5 years.`);
@@ -136,7 +136,7 @@ class CityScout {
         }
         
         // Employment insights (demographic context only)
-        if (data.unemployment_rate !== undefined) {
+        if (data.unemployment_rate != null) {
             const unemployment = data.unemployment_rate;
             if (unemployment < 3) {
                 insights.push(`Very low unemployment rate of ${this.formatPercentage(unemployment)}.`);
@@ -0,0 +1,10 @@
+"""
+Utilities package for CityScout.
+Contains helper functions and utilities.
+"""
+
+from .data_formatter import DataFormatter
+from .validators import CityValidator, MAX_INPUT_LENGTH, US_STATES
+from .ttl_cache import TTLCache
+
+__all__ = ['DataFormatter', 'CityValidator', 'TTLCache', 'US_STATES', 'MAX_INPUT_LENGTH']
@@ -0,0 +1,129 @@
+from typing import Final, Tuple
+import csv
+import io
+import orjson
+from datetime import datetime
+
+from ..models import CityAnalysis
+
+# Magnitude scales as (threshold, suffix, decimals), largest first
+_CURRENCY_SCALES: Final[Tuple[Tuple[int, str, int], ...]] = ((1_000_000, 'M', 1), (1_000, 'K', 0))
+# Magnitude scales as (threshold, suffix), largest first
+_NUMBER_SCALES: Final[Tuple[Tuple[int, str], ...]] = ((1_000_000, 'M'), (1_000, 'K'))
+
+class DataFormatter:
+    """Formats data for various output types (CLI, JSON, CSV)."""
+    
+    @staticmethod
+    def format_currency(amount: float) -> str:
+        """Format currency values."""
+        for threshold, suffix, decimals in _CURRENCY_SCALES:
+            if amount >= threshold:
+                return f"${amount/threshold:.{decimals}f}{suffix}"
+        return f"${amount:,.0f}"
+            
+    @staticmethod
+    def format_percentage(value: float) -> str:
+        """Format percentage values."""
+        return f"{value:.1f}%"
+        
+    @staticmethod
+    def format_number(value: float, decimals: int = 1) -> str:
+        """Format general numbers."""
+        for threshold, suffix in _NUMBER_SCALES:
+            if value >= threshold:
+                return f"{value/threshold:.{decimals}f}{suffix}"
+        return f"{value:,.{decimals}f}"
+            
+    @staticmethod
+    def format_for_cli(data: CityAnalysis) -> str:
+        """Format data for command-line output."""
+        try:
+            output = []
+            output.append("=" * 60)
+            output.append(f"CityScout Analysis: {data.city or 'Unknown City'}")
+            output.append("=" * 60)
+            
+            # Demographics
+            output.append("\n📊 DEMOGRAPHICS")
+            output.append("-" * 30)
+            if data.total_population is not None:
+                output.append(f"Population: {DataFormatter.format_number(data.total_population, 0)}")
+            if data.population_growth_5yr is not None:
+                output.append(f"5-Year Growth: {DataFormatter.format_percentage(data.population_growth_5yr)}")
+            if data.median_household_income is not None:
+                output.append(f"Median Income: {DataFormatter.format_currency(data.median_household_income)}")
+            if data.unemployment_rate is not None:
+                output.append(f"Unemployment Rate: {DataFormatter.format_percentage(data.unemployment_rate)}")
+                    
+            output.append("\n" + "=" * 60)
+            output.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            output.append("=" * 60)
+            
+            return "\n".join(output)
+            
+        except Exception as e:
+            return f"Error formatting CLI output: {e}"
+            
+    @staticmethod
+    def format_for_json(data: CityAnalysis) -> str:
+        """Format data for JSON output."""
+        try:
+            now = datetime.now()
+            
+            # Create a clean JSON structure
+            json_data = {
+                "metadata": {
+                    "generated_at": now.isoformat(),
+                    "tool": "CityScout",
+                    "version": "1.0.0"
+                },
+                "city_info": {
+                    "city": data.city,
+                    "state": data.state,
+                    "analysis_date": now.strftime('%Y-%m-%d')
+                },
+                "demographics": {
+                    "total_population": data.total_population,
+                    "population_growth_5yr": data.population_growth_5yr,
+                    "median_household_income": data.median_household_income,
+                    "unemployment_rate": data.unemployment_rate
+                }
+            }
+            
+            return orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode()
+            
+        except Exception as e:
+            return orjson.dumps({"error": f"Error formatting JSON output: {e}"}, option=orjson.OPT_INDENT_2).decode()
+            
+    @staticmethod
+    def format_for_csv(data: CityAnalysis) -> str:
+        """Format data for CSV output."""
+        try:
+            headers = [
+                "City", "State", "Population", "Population Growth 5yr (%)",
+                "Median Income", "Unemployment Rate (%)", "Analysis Date"
+            ]
+            
+            values = [
+                data.city,
+                data.state,
+                data.total_population,
+                data.population_growth_5yr,
+                data.median_household_income,
+                data.unemployment_rate,
+                datetime.now().strftime('%Y-%m-%d')
+            ]
+            
+            # Convert values to strings and handle None values
+            str_values = [str(v) if v is not None else '' for v in values]
+            
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+            writer.writerow(headers)
+            writer.writerow(str_values)
+            
+            return buffer.getvalue()
+            
+        except Exception as e:
+            return f"Error formatting CSV output: {e}"
@@ -0,0 +1,312 @@
+import re
+import string
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Dict, Final, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Levenshtein
+
+__all__ = ['CityValidator', 'US_STATES', 'MAX_INPUT_LENGTH']
+
+# Longest raw input accepted; anything longer is rejected before reaching the
+# lru_caches, which would otherwise keep arbitrarily large client strings alive
+MAX_INPUT_LENGTH: Final = 100
+
+# Characters allowed in city names: letters, whitespace, hyphens, apostrophes and periods
+_CITY_CHARS = frozenset(string.ascii_letters + string.whitespace + "-'.")
+# Parts of a city name capitalized on normalization ("st. louis" -> "St. Louis",
+# "winston-salem" -> "Winston-Salem", "o'fallon" -> "O'fallon")
+_WORD_RE = re.compile(r"[^\s-]+")
+# Characters stripped when suggesting a cleaned-up city name
+_CITY_CLEAN_RE = re.compile(r"[^a-zA-Z\s\-']")
+
+# US state abbreviations
+US_STATES: Final[Mapping[str, str]] = MappingProxyType({
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
+    'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
+    'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
+    'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+    'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
+    'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
+    'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+    'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
+    'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
+    'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
+})
+# Abbreviations alone, for membership tests
+_STATE_ABBREVS: Final[FrozenSet[str]] = frozenset(US_STATES)
+
+class CityValidator:
+    """Validates and normalizes city and state inputs."""
+    
+    # Kept on the class for callers that predate the module-level constant
+    US_STATES: ClassVar[Mapping[str, str]] = US_STATES
+    
+    @staticmethod
+    def validate_city_name(city: object) -> bool:
+        """Validate city name format."""
+        if not city or not isinstance(city, str) or len(city) > MAX_INPUT_LENGTH:
+            return False
+        return _check_and_normalize_city(city) is not None
+        
+    @staticmethod
+    def validate_state(state: object) -> bool:
+        """Validate state abbreviation or name."""
+        if not state or not isinstance(state, str) or len(state) > MAX_INPUT_LENGTH:
+            return False
+        return _check_and_normalize_state(state) is not None
+        
+    @staticmethod
+    def normalize_city_name(city: object) -> str:
+        """Normalize city name to standard format."""
+        normalized = (_check_and_normalize_city(city)
+                      if city and isinstance(city, str) and len(city) <= MAX_INPUT_LENGTH else None)
+        if normalized is None:
+            raise ValueError(f"Invalid city name: {city}")
+        return normalized
+        
+    @staticmethod
+    def normalize_state(state: object) -> str:
+        """Normalize state to standard abbreviation format."""
+        normalized = (_check_and_normalize_state(state)
+                      if state and isinstance(state, str) and len(state) <= MAX_INPUT_LENGTH else None)
+        if normalized is None:
+            raise ValueError(f"Invalid state: {state}")
+        return normalized
+        
+    @staticmethod
+    def parse_location(location: object) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Parse a location string to extract city and state.
+        Handles formats like:
+        - "Tampa, FL"
+        - "Tampa, Florida"
+        - "New York City, NY"
+        - "St. Louis, Missouri"
+        """
+        if not location or not isinstance(location, str) or len(location) > MAX_INPUT_LENGTH:
+            return None, None
+        return _parse_location(location)
+        
+    @staticmethod
+    def parse_locations(locations: Iterable[object]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Parse many location strings at once, in input order.
+        Each entry is parsed as by parse_location; repeated locations are cache hits.
+        """
+        parse = _parse_location
+        return [
+            parse(location)
+            if location and isinstance(location, str) and len(location) <= MAX_INPUT_LENGTH
+            else (None, None)
+            for location in locations
+        ]
+        
+    @staticmethod
+    def suggest_corrections(city: Optional[str], state: Optional[str]) -> Dict[str, List[str]]:
+        """Suggest corrections for invalid city/state inputs."""
+        suggestions: Dict[str, List[str]] = {'city': [], 'state': []}
+        
+        # State suggestions
+        if state and len(state) <= MAX_INPUT_LENGTH and _check_and_normalize_state(state) is None:
+            query = state.upper().strip()
+            state_matches = []
+            
+            # Score every state name at once in rapidfuzz's C implementation
+            for name_upper, _, _ in process.extract(query, _STATE_NAMES_UPPER, scorer=fuzz.WRatio,
+                                                    score_cutoff=75, limit=5):
+                state_matches.append(_NAME_TO_ABBREV[name_upper])
+                
+            # Abbreviations starting with the input, e.g. "N" -> NE, NV, NH, ...
+            state_matches.extend(_ABBREVS_BY_PREFIX.get(query, ()))
+            
+            # Look for likely typos of state names, e.g. "Calfornia"
+            max_distance = 1 if len(query) <= 5 else 2
+            for name_upper, _, _ in process.extract(query, _STATE_NAMES_UPPER, scorer=Levenshtein.distance,
+                                                    score_cutoff=max_distance, limit=None):
+                state_matches.append(_NAME_TO_ABBREV[name_upper])
+                
+            for abbrev in dict.fromkeys(state_matches):
+                suggestions['state'].append(f"{US_STATES[abbrev]} ({abbrev})")
+                
+        # City suggestions (basic implementation)
+        if city and len(city) <= MAX_INPUT_LENGTH and _check_and_normalize_city(city) is None:
+            # Remove invalid characters and suggest
+            cleaned_city = _CITY_CLEAN_RE.sub('', city)
+            if cleaned_city and cleaned_city != city:
+                suggestions['city'].append(cleaned_city)
+                
+        return suggestions
+        
+    @staticmethod
+    def is_major_city(city: str, state: str) -> bool:
+        """Check if the city is a major U.S. city (for data availability)."""
+        state = state.upper()
+        state_cities = _MAJOR_CITY_LOOKUP.get(state)
+        if not state_cities:
+            return False
+            
+        city = city.lower()
+        if city in state_cities:
+            return True
+            
+        # Fall back to partial matches, e.g. "New York City" -> "new york":
+        # a major city name inside the input, or the input inside a city name
+        names_pattern, names_haystack = _MAJOR_CITY_PARTIAL[state]
+        if names_pattern.search(city):
+            return True
+        return _NAME_SEPARATOR not in city and city in names_haystack
+
+# Upper-cased state names mapped to their abbreviations, built once for O(1) lookups.
+# Strings built at import time are interned so they share identity with the
+# normalized values handed back to callers, letting dict lookups short-circuit.
+_NAME_TO_ABBREV = {
+    sys.intern(name.upper()): sys.intern(abbrev)
+    for abbrev, name in US_STATES.items()
+}
+_STATE_NAMES_UPPER = tuple(_NAME_TO_ABBREV)
+
+# State abbreviations grouped by each of their prefixes ("N" -> NE, NV, ...; "NE" -> NE)
+_ABBREVS_BY_PREFIX: Dict[str, List[str]] = {}
+for _abbrev in US_STATES:
+    for _end in range(1, len(_abbrev) + 1):
+        _ABBREVS_BY_PREFIX.setdefault(_abbrev[:_end], []).append(_abbrev)
+
+# Major cities that typically have good data availability
+_MAJOR_CITIES = {
+    'NY': ['New York', 'Buffalo', 'Rochester', 'Syracuse', 'Albany'],
+    'CA': ['Los Angeles', 'San Francisco', 'San Diego', 'San Jose', 'Sacramento', 
+           'Fresno', 'Oakland', 'Long Beach', 'Anaheim'],
+    'TX': ['Houston', 'Dallas', 'Austin', 'San Antonio', 'Fort Worth', 'El Paso'],
+    'FL': ['Miami', 'Tampa', 'Orlando', 'Jacksonville', 'St. Petersburg'],
+    'IL': ['Chicago', 'Aurora', 'Rockford', 'Joliet', 'Naperville'],
+    'PA': ['Philadelphia', 'Pittsburgh', 'Allentown', 'Erie'],
+    'OH': ['Columbus', 'Cleveland', 'Cincinnati', 'Toledo', 'Akron'],
+    'GA': ['Atlanta', 'Augusta', 'Columbus', 'Savannah'],
+    'NC': ['Charlotte', 'Raleigh', 'Greensboro', 'Durham', 'Winston-Salem'],
+    'MI': ['Detroit', 'Grand Rapids', 'Warren', 'Sterling Heights', 'Lansing'],
+    'WA': ['Seattle', 'Spokane', 'Tacoma', 'Vancouver', 'Bellevue'],
+    'AZ': ['Phoenix', 'Tucson', 'Mesa', 'Chandler', 'Scottsdale'],
+    'MA': ['Boston', 'Worcester', 'Springfield', 'Lowell', 'Cambridge'],
+    'TN': ['Nashville', 'Memphis', 'Knoxville', 'Chattanooga'],
+    'IN': ['Indianapolis', 'Fort Wayne', 'Evansville', 'South Bend'],
+    'MO': ['Kansas City', 'St. Louis', 'Springfield', 'Independence'],
+    'MD': ['Baltimore', 'Frederick', 'Rockville', 'Gaithersburg'],
+    'WI': ['Milwaukee', 'Madison', 'Green Bay', 'Kenosha'],
+    'MN': ['Minneapolis', 'St. Paul', 'Plymouth', 'Woodbury'],
+    'CO': ['Denver', 'Colorado Springs', 'Aurora', 'Fort Collins', 'Lakewood'],
+    'AL': ['Birmingham', 'Montgomery', 'Mobile', 'Huntsville'],
+    'SC': ['Charleston', 'Columbia', 'North Charleston', 'Mount Pleasant'],
+    'LA': ['New Orleans', 'Baton Rouge', 'Shreveport', 'Lafayette'],
+    'KY': ['Louisville', 'Lexington', 'Bowling Green', 'Owensboro'],
+    'OR': ['Portland', 'Eugene', 'Salem', 'Gresham'],
+    'OK': ['Oklahoma City', 'Tulsa', 'Norman', 'Broken Arrow'],
+    'CT': ['Bridgeport', 'New Haven', 'Hartford', 'Stamford'],
+    'IA': ['Des Moines', 'Cedar Rapids', 'Davenport', 'Sioux City'],
+    'MS': ['Jackson', 'Gulfport', 'Southaven', 'Hattiesburg'],
+    'AR': ['Little Rock', 'Fort Smith', 'Fayetteville', 'Springdale'],
+    'KS': ['Wichita', 'Overland Park', 'Kansas City', 'Topeka'],
+    'UT': ['Salt Lake City', 'West Valley City', 'Provo', 'West Jordan'],
+    'NV': ['Las Vegas', 'Henderson', 'Reno', 'North Las Vegas'],
+    'NM': ['Albuquerque', 'Las Cruces', 'Rio Rancho', 'Santa Fe'],
+    'WV': ['Charleston', 'Huntington', 'Morgantown', 'Parkersburg'],
+    'NE': ['Omaha', 'Lincoln', 'Bellevue', 'Grand Island'],
+    'ID': ['Boise', 'Meridian', 'Nampa', 'Idaho Falls'],
+    'HI': ['Honolulu', 'East Honolulu', 'Pearl City', 'Hilo'],
+    'NH': ['Manchester', 'Nashua', 'Concord', 'Derry'],
+    'ME': ['Portland', 'Lewiston', 'Bangor', 'South Portland'],
+    'RI': ['Providence', 'Cranston', 'Warwick', 'Pawtucket'],
+    'MT': ['Billings', 'Missoula', 'Great Falls', 'Bozeman'],
+    'DE': ['Wilmington', 'Dover', 'Newark', 'Middletown'],
+    'SD': ['Sioux Falls', 'Rapid City', 'Aberdeen', 'Brookings'],
+    'ND': ['Fargo', 'Bismarck', 'Grand Forks', 'Minot'],
+    'AK': ['Anchorage', 'Fairbanks', 'Juneau', 'Sitka'],
+    'DC': ['Washington'],
+    'VT': ['Burlington', 'Essex', 'South Burlington', 'Colchester'],
+    'WY': ['Cheyenne', 'Casper', 'Laramie', 'Gillette']
+}
+
+# Lower-cased major city names per state for is_major_city
+_MAJOR_CITY_LOOKUP = {
+    sys.intern(state): frozenset(sys.intern(city.lower()) for city in cities)
+    for state, cities in _MAJOR_CITIES.items()
+}
+
+# Per-state partial matchers for is_major_city: one compiled alternation finds any
+# city name inside the input in a single scan, and the separator-joined names let
+# one substring search find the input inside any city name.
+_NAME_SEPARATOR = '\0'
+_MAJOR_CITY_PARTIAL = {
+    state: (
+        re.compile('|'.join(re.escape(city) for city in sorted(cities, key=len, reverse=True))),
+        _NAME_SEPARATOR.join(cities)
+    )
+    for state, cities in _MAJOR_CITY_LOOKUP.items()
+}
+
+# Cached implementations behind the CityValidator methods. City and state inputs
+# repeat heavily, so repeated lookups cost a dict hit instead of re-validating.
+# Validation and normalization share one pass; None marks an invalid input.
+
+def _capitalize_match(match: 're.Match[str]') -> str:
+    """Capitalize one regex-matched part of a city name."""
+    return match.group(0).capitalize()
+
+@lru_cache(maxsize=4096)
+def _check_and_normalize_city(city: str) -> Optional[str]:
+    """Validate and normalize a city name in one pass; None if it's invalid."""
+    # Remove extra whitespace
+    city = city.strip()
+    
+    # Check length
+    if len(city) < 2 or len(city) > 50:
+        return None
+        
+    # Check for valid characters (letters, spaces, hyphens, apostrophes); every
+    # allowed character is ASCII, and str.isascii() is O(1) in CPython
+    if not city.isascii() or not _CITY_CHARS.issuperset(city):
+        return None
+        
+    # Collapse inner whitespace and capitalize each space- or hyphen-separated part
+    return _WORD_RE.sub(_capitalize_match, ' '.join(city.split()))
+
+@lru_cache(maxsize=4096)
+def _check_and_normalize_state(state: str) -> Optional[str]:
+    """Map a state abbreviation or name to its abbreviation; None if it's invalid."""
+    state = state.strip().upper()
+    
+    # If it's already an abbreviation, return the interned copy
+    if state in _STATE_ABBREVS:
+        return sys.intern(state)
+        
+    # Otherwise it must be a state name
+    return _NAME_TO_ABBREV.get(state)
+
+@lru_cache(maxsize=4096)
+def _parse_location(location: str) -> Tuple[Optional[str], Optional[str]]:
+    """Parse a non-empty location string into (city, state)."""
+    # Split on the first comma; a second comma means too many parts
+    city_part, sep, state_part = location.partition(',')
+    
+    if sep:
+        if ',' in state_part:
+            return None, None
+            
+        try:
+            normalized_city = CityValidator.normalize_city_name(city_part.strip())
+            normalized_state = CityValidator.normalize_state(state_part.strip())
+            return normalized_city, normalized_state
+        except ValueError:
+            return None, None
+    else:
+        # Only city provided
+        try:
+            normalized_city = CityValidator.normalize_city_name(city_part.strip())
+            return normalized_city, None
+        except ValueError:
+            return None, None
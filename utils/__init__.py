@@ -1,9 +0,0 @@
-"""
-Utilities package for CityScout.
-Contains helper functions and utilities.
-"""
-
-from .data_formatter import DataFormatter
-from .validators import CityValidator
-
-__all__ = ['DataFormatter', 'CityValidator']